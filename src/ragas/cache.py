@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import typing as t
+from abc import ABC, abstractmethod
+
+from ragas.utils import get_cache_dir
+
+# default passed to CacheInterface.get to tell a miss from a cached None
+MISSING = object()
+
+
+class CacheInterface(ABC):
+    """
+    Key-value store used to cache LLM generations and embeddings so that
+    repeated calls with the same inputs skip the model entirely.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        """
+        Return the value stored under key, or default when it is missing.
+        Pass MISSING as the default to check for a hit in a single lookup.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: t.Any) -> None:
+        ...
+
+
+class InMemoryCache(CacheInterface):
+    """
+    Cache that lives for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self._store: t.Dict[str, t.Any] = {}
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self._store.get(key, default)
+
+    def set(self, key: str, value: t.Any) -> None:
+        self._store[key] = value
+
+
+class DiskCacheBackend(CacheInterface):
+    """
+    Cache persisted on disk with `diskcache` so that hits survive restarts.
+
+    Attributes
+    ----------
+    cache_dir: str
+        Directory to store the cache in. Defaults to `<ragas cache dir>/cache`.
+    """
+
+    def __init__(self, cache_dir: t.Optional[str] = None):
+        try:
+            from diskcache import Cache
+        except ImportError as exc:
+            raise ImportError(
+                "Could not import diskcache python package. "
+                "Please install it with `pip install diskcache`."
+            ) from exc
+
+        self.cache_dir = cache_dir or os.path.join(get_cache_dir(), "cache")
+        self.cache = Cache(self.cache_dir)
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        return self.cache.get(key, default)
+
+    def set(self, key: str, value: t.Any) -> None:
+        self.cache.set(key, value)
+
+    def __del__(self):
+        if hasattr(self, "cache"):
+            self.cache.close()
+
+
+def make_cache_key(*parts: t.Any) -> str:
+    """
+    Return a stable digest for the given parts. Parts must be json
+    serializable, anything else is serialized with `str`.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import typing as t
 from abc import ABC
 from dataclasses import field
@@ -8,9 +9,11 @@ from typing import List
 
 import numpy as np
 from langchain_core.embeddings import Embeddings
+from langchain_core.pydantic_v1 import BaseModel
 from langchain_openai.embeddings import OpenAIEmbeddings
 from pydantic.dataclasses import dataclass
 
+from ragas.cache import MISSING, CacheInterface, make_cache_key
 from ragas.run_config import RunConfig, add_async_retry, add_retry
 
 DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
@@ -18,6 +21,38 @@ DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
 
 class BaseRagasEmbeddings(Embeddings, ABC):
     run_config: RunConfig
+    cache: t.Optional[CacheInterface] = None
+
+    def get_cache_namespace(self) -> t.Dict[str, t.Any]:
+        """Return the parameters that identify the model in cache keys."""
+        return {"embeddings": self.__class__.__name__}
+
+    async def embed_query_text(self, text: str, is_async=True) -> List[float]:
+        """
+        Embed a search query through embed_query. Asymmetric models such as
+        BGE or E5 prepend an instruction to queries only, so they embed a
+        query differently from the same text passed to embed_texts.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(self.get_cache_namespace(), "query", text)
+            emb = self.cache.get(cache_key, MISSING)
+            if emb is not MISSING:
+                return emb
+
+        if is_async:
+            aembed_query_with_retry = add_async_retry(
+                self.aembed_query, self.run_config
+            )
+            emb = await aembed_query_with_retry(text)
+        else:
+            loop = asyncio.get_event_loop()
+            embed_query_with_retry = add_retry(self.embed_query, self.run_config)
+            emb = await loop.run_in_executor(None, embed_query_with_retry, text)
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, emb)
+        return emb
 
     async def embed_text(self, text: str, is_async=True) -> List[float]:
         embs = await self.embed_texts([text], is_async=is_async)
@@ -25,6 +60,26 @@ class BaseRagasEmbeddings(Embeddings, ABC):
 
     async def embed_texts(
         self, texts: List[str], is_async: bool = True
+    ) -> t.List[t.List[float]]:
+        if self.cache is None:
+            return await self._embed_texts(texts, is_async=is_async)
+
+        # only embed the texts that are not cached yet
+        namespace = self.get_cache_namespace()
+        keys = [make_cache_key(namespace, text) for text in texts]
+        embs = [self.cache.get(key, MISSING) for key in keys]
+        missing = [i for i, emb in enumerate(embs) if emb is MISSING]
+        if missing:
+            new_embs = await self._embed_texts(
+                [texts[i] for i in missing], is_async=is_async
+            )
+            for i, emb in zip(missing, new_embs):
+                self.cache.set(keys[i], emb)
+                embs[i] = emb
+        return embs
+
+    async def _embed_texts(
+        self, texts: List[str], is_async: bool = True
     ) -> t.List[t.List[float]]:
         if is_async:
             aembed_documents_with_retry = add_async_retry(
@@ -44,12 +99,29 @@ class BaseRagasEmbeddings(Embeddings, ABC):
 
 class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
     def __init__(
-        self, embeddings: Embeddings, run_config: t.Optional[RunConfig] = None
+        self,
+        embeddings: Embeddings,
+        run_config: t.Optional[RunConfig] = None,
+        cache: t.Optional[CacheInterface] = None,
     ):
         self.embeddings = embeddings
         if run_config is None:
             run_config = RunConfig()
         self.set_run_config(run_config)
+        self.cache = cache
+
+    def get_cache_namespace(self) -> t.Dict[str, t.Any]:
+        namespace = {"embeddings": self.embeddings.__class__.__name__}
+        if isinstance(self.embeddings, BaseModel):
+            # key on every parameter of the wrapped model (model, model_name,
+            # dimensions, ...), leaving out clients and secrets
+            for name, value in self.embeddings.dict().items():
+                try:
+                    json.dumps(value)
+                except (TypeError, ValueError):
+                    continue
+                namespace[name] = value
+        return namespace
 
     def embed_query(self, text: str) -> List[float]:
         return self.embeddings.embed_query(text)
@@ -78,7 +150,7 @@ class LangchainEmbeddingsWrapper(BaseRagasEmbeddings):
             self.run_config.exception_types = RateLimitError
 
 
-@dataclass
+@dataclass(config={"arbitrary_types_allowed": True})
 class HuggingfaceEmbeddings(BaseRagasEmbeddings):
     model_name: str = DEFAULT_MODEL_NAME
     """Model name to use."""
@@ -88,6 +160,9 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
     model_kwargs: t.Dict[str, t.Any] = field(default_factory=dict)
     """Keyword arguments to pass to the model."""
     encode_kwargs: t.Dict[str, t.Any] = field(default_factory=dict)
+    """Keyword arguments to pass to encode and predict."""
+    cache: t.Optional[CacheInterface] = None
+    """Cache for embeddings and cross encoder scores."""
 
     def __post_init__(self):
         try:
@@ -122,24 +197,53 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
         if "convert_to_tensor" not in self.encode_kwargs:
             self.encode_kwargs["convert_to_tensor"] = True
 
+    def get_cache_namespace(self) -> t.Dict[str, t.Any]:
+        # model and encode options change the outputs, so they are part of the key
+        return {
+            "embeddings": self.__class__.__name__,
+            "model": self.model_name,
+            "model_kwargs": self.model_kwargs,
+            "encode_kwargs": self.encode_kwargs,
+        }
+
     def embed_query(self, text: str) -> List[float]:
         return self.embed_documents([text])[0]
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        import torch
         from sentence_transformers.SentenceTransformer import SentenceTransformer
         from torch import Tensor
 
         assert isinstance(
             self.model, SentenceTransformer
         ), "Model is not of the type Bi-encoder"
-        embeddings = self.model.encode(
-            texts, normalize_embeddings=True, **self.encode_kwargs
-        )
+        # inference mode also skips the autograd version counters no_grad keeps
+        with torch.inference_mode():
+            embeddings = self.model.encode(
+                texts, normalize_embeddings=True, **self.encode_kwargs
+            )
 
         assert isinstance(embeddings, Tensor)
         return embeddings.tolist()
 
     def predict(self, texts: List[List[str]]) -> List[List[float]]:
+        if self.cache is None:
+            return self._predict(texts)
+
+        # scores are deterministic for a given model, only score uncached pairs
+        namespace = {**self.get_cache_namespace(), "task": "predict"}
+        keys = [make_cache_key(namespace, pair) for pair in texts]
+        predictions = [self.cache.get(key, MISSING) for key in keys]
+        missing = [i for i, pred in enumerate(predictions) if pred is MISSING]
+        if missing:
+            new_predictions = self._predict([texts[i] for i in missing])
+            for i, prediction in zip(missing, new_predictions):
+                self.cache.set(keys[i], prediction)
+                predictions[i] = prediction
+        return predictions
+
+    def _predict(self, texts: List[List[str]]) -> List[List[float]]:
+        import torch
         from sentence_transformers.cross_encoder import CrossEncoder
         from torch import Tensor
 
@@ -147,10 +251,17 @@ class HuggingfaceEmbeddings(BaseRagasEmbeddings):
             self.model, CrossEncoder
         ), "Model is not of the type CrossEncoder"
 
-        predictions = self.model.predict(texts, **self.encode_kwargs)
+        # each batch is padded to its longest pair, so score pairs of similar
+        # length together and restore the caller's order afterwards
+        order = np.argsort([sum(map(len, pair)) for pair in texts], kind="stable")
+        with torch.inference_mode():
+            predictions = self.model.predict(
+                [texts[i] for i in order], **self.encode_kwargs
+            )
 
         assert isinstance(predictions, Tensor)
-        return predictions.tolist()
+        scores = predictions.tolist()
+        return [scores[i] for i in np.argsort(order)]
 
 
 def embedding_factory(run_config: t.Optional[RunConfig] = None) -> BaseRagasEmbeddings:
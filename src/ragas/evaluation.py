@@ -189,7 +189,8 @@ def evaluate(
     evaluation_rm, evaluation_group_cm = new_group(
         name="ragas evaluation", inputs={}, callbacks=callbacks, is_async=is_async
     )
-    for i, row in enumerate(dataset):
+    # convert the arrow table to python rows in one pass instead of per row
+    for i, row in enumerate(dataset.to_list()):
         row = t.cast(t.Dict[str, t.Any], row)
         row_rm, row_group_cm = new_group(
             name=f"row {i}",
@@ -213,10 +214,9 @@ def evaluate(
             raise ExceptionInRunner()
 
         # convert results to dataset_like
-        for i, _ in enumerate(dataset):
-            s = {}
-            for j, m in enumerate(metrics):
-                s[m.name] = results[len(metrics) * i + j]
+        for i in range(len(dataset)):
+            row_results = results[len(metrics) * i : len(metrics) * (i + 1)]
+            s = {m.name: r for m, r in zip(metrics, row_results)}
             scores.append(s)
             # close the row chain
             row_rm, row_group_cm = row_run_managers[i]
@@ -78,7 +78,7 @@ class Runner(threading.Thread):
             try:
                 r = await future
             except MaxRetriesExceeded as e:
-                logger.warning(f"max retries exceeded for {e.evolution}")
+                logger.warning("max retries exceeded for %s", e.evolution)
             except Exception as e:
                 if self.raise_exceptions:
                     raise e
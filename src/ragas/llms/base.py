@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import partial
@@ -15,11 +16,13 @@ from langchain_openai.chat_models import AzureChatOpenAI, ChatOpenAI
 from langchain_openai.llms import AzureOpenAI, OpenAI
 from langchain_openai.llms.base import BaseOpenAI
 
+from ragas.cache import MISSING, make_cache_key
 from ragas.run_config import RunConfig, add_async_retry, add_retry
 
 if t.TYPE_CHECKING:
     from langchain_core.callbacks import Callbacks
 
+    from ragas.cache import CacheInterface
     from ragas.llms.prompt import PromptValue
 
 logger = logging.getLogger(__name__)
@@ -45,10 +48,39 @@ def is_multiple_completion_supported(llm: BaseLanguageModel) -> bool:
 @dataclass
 class BaseRagasLLM(ABC):
     run_config: RunConfig
+    # a class attribute rather than a field, so that dataclass subclasses can
+    # still declare fields without defaults
+    cache = None  # type: t.Optional[CacheInterface]
 
     def set_run_config(self, run_config: RunConfig):
         self.run_config = run_config
 
+    def get_cache_namespace(self) -> t.Dict[str, t.Any]:
+        """Return the parameters that identify the model in cache keys."""
+        return {"llm": self.__class__.__name__}
+
+    def get_request_semaphore(self) -> t.Optional[asyncio.Semaphore]:
+        """
+        Return the semaphore that caps requests in flight on the running event
+        loop at run_config.max_workers. Metrics send several requests per row
+        concurrently, so the Executor's per-row limit does not bound them.
+        """
+        max_workers = self.run_config.max_workers
+        if max_workers == -1:
+            return None
+
+        # a semaphore belongs to one event loop and score() runs a new loop per call
+        semaphores = getattr(self, "_request_semaphores", None)
+        if semaphores is None:
+            semaphores = weakref.WeakKeyDictionary()
+            self._request_semaphores = semaphores
+        loop = asyncio.get_running_loop()
+        size, semaphore = semaphores.get(loop, (None, None))
+        if semaphore is None or size != max_workers:
+            semaphore = asyncio.Semaphore(max_workers)
+            semaphores[loop] = (max_workers, semaphore)
+        return semaphore
+
     def get_temperature(self, n: int) -> float:
         """Return the temperature to use for completion based on n."""
         return 0.3 if n > 1 else 1e-8
@@ -85,6 +117,39 @@ class BaseRagasLLM(ABC):
         is_async: bool = True,
     ) -> LLMResult:
         """Generate text using the given event loop."""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                self.get_cache_namespace(), prompt.to_string(), n, temperature, stop
+            )
+            cached = self.cache.get(cache_key, MISSING)
+            if cached is not MISSING:
+                return cached
+
+        semaphore = self.get_request_semaphore()
+        if semaphore is None:
+            result = await self._generate(
+                prompt, n, temperature, stop, callbacks, is_async
+            )
+        else:
+            async with semaphore:
+                result = await self._generate(
+                    prompt, n, temperature, stop, callbacks, is_async
+                )
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    async def _generate(
+        self,
+        prompt: PromptValue,
+        n: int,
+        temperature: float,
+        stop: t.Optional[t.List[str]],
+        callbacks: Callbacks,
+        is_async: bool,
+    ) -> LLMResult:
         if is_async:
             agenerate_text_with_retry = add_async_retry(
                 self.agenerate_text, self.run_config
@@ -119,12 +184,22 @@ class LangchainLLMWrapper(BaseRagasLLM):
     """
 
     def __init__(
-        self, langchain_llm: BaseLanguageModel, run_config: t.Optional[RunConfig] = None
+        self,
+        langchain_llm: BaseLanguageModel,
+        run_config: t.Optional[RunConfig] = None,
+        cache: t.Optional[CacheInterface] = None,
     ):
         self.langchain_llm = langchain_llm
         if run_config is None:
             run_config = RunConfig()
         self.set_run_config(run_config)
+        self.cache = cache
+
+    def get_cache_namespace(self) -> t.Dict[str, t.Any]:
+        return {
+            "llm": self.langchain_llm.__class__.__name__,
+            **getattr(self.langchain_llm, "_identifying_params", {}),
+        }
 
     def generate_text(
         self,
@@ -135,7 +210,8 @@ class LangchainLLMWrapper(BaseRagasLLM):
         callbacks: Callbacks = None,
     ) -> LLMResult:
         temperature = self.get_temperature(n=n)
-        if is_multiple_completion_supported(self.langchain_llm):
+        # only send n when more than one completion is needed
+        if n > 1 and is_multiple_completion_supported(self.langchain_llm):
             return self.langchain_llm.generate_prompt(
                 prompts=[prompt],
                 n=n,
@@ -165,7 +241,7 @@ class LangchainLLMWrapper(BaseRagasLLM):
         callbacks: Callbacks = None,
     ) -> LLMResult:
         temperature = self.get_temperature(n=n)
-        if is_multiple_completion_supported(self.langchain_llm):
+        if n > 1 and is_multiple_completion_supported(self.langchain_llm):
             return await self.langchain_llm.agenerate_prompt(
                 prompts=[prompt],
                 n=n,
@@ -16,6 +16,13 @@ if t.TYPE_CHECKING:
 
     from ragas.llms.base import BaseRagasLLM
 
+try:
+    import orjson
+
+    _json_loads: t.Callable[[str], t.Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def load_as_json(text) -> t.Dict:
     """
@@ -23,9 +30,9 @@ def load_as_json(text) -> t.Dict:
     """
 
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except ValueError as e:
-        logger.warn(f"Invalid json: {e}")
+        logger.warning("Invalid json: %s", e)
         return {}
 
 
@@ -142,6 +149,15 @@ class JsonLoader:
             )
 
     def _load_all_jsons(self, text):
+        # fast path: the whole response is a single json document
+        try:
+            _json = _json_loads(text)
+        except ValueError:
+            pass
+        else:
+            if isinstance(_json, (dict, list)):
+                return [_json]
+
         start, end = self._find_outermost_json(text)
         _json = json.loads(text[start:end])
         text = text.replace(text[start:end], "", 1)
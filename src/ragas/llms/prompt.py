@@ -7,7 +7,7 @@ import typing as t
 
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_core.prompt_values import PromptValue as BasePromptValue
-from langchain_core.pydantic_v1 import BaseModel, root_validator
+from langchain_core.pydantic_v1 import BaseModel, PrivateAttr, root_validator
 
 from ragas.llms import BaseRagasLLM
 from ragas.llms.json_load import json_loader
@@ -53,6 +53,10 @@ class Prompt(BaseModel):
     output_type: t.Literal["json", "str"] = "json"
     language: str = "english"
 
+    # (fingerprint, rendered template) reused by format() while the content
+    # the template is rendered from stays the same
+    _prompt_template: t.Optional[t.Tuple[str, str]] = PrivateAttr(default=None)
+
     @root_validator
     def validate_prompt(cls, values: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
         """
@@ -157,8 +161,28 @@ class Prompt(BaseModel):
             raise ValueError(
                 f"Input variables {self.input_keys} do not match with the given parameters {list(kwargs.keys())}"
             )
-        prompt = self.to_string()
-        return PromptValue(prompt_str=prompt.format(**kwargs))
+        return PromptValue(prompt_str=self._get_template().format(**kwargs))
+
+    def _get_template(self) -> str:
+        """
+        Return the rendered template, re-rendering it when the prompt changed.
+        The fingerprint also catches copies and in-place edits of examples.
+        """
+        fingerprint = json.dumps(
+            [
+                self.instruction,
+                self.output_format_instruction,
+                self.examples,
+                self.input_keys,
+                self.output_key,
+                self.output_type,
+            ],
+            ensure_ascii=False,
+            default=str,
+        )
+        if self._prompt_template is None or self._prompt_template[0] != fingerprint:
+            self._prompt_template = (fingerprint, self.to_string())
+        return self._prompt_template[1]
 
     def adapt(
         self, language: str, llm: BaseRagasLLM, cache_dir: t.Optional[str] = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -139,7 +140,9 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings):
         score = tp / (tp + 0.5 * (fp + fn)) if tp > 0 else 0
         return score
 
-    async def _ascore(self, row: t.Dict, callbacks: Callbacks, is_async: bool) -> float:
+    async def _ascore_factuality(
+        self, row: t.Dict, callbacks: Callbacks, is_async: bool
+    ) -> float:
         assert self.llm is not None, "LLM must be set"
 
         q, a, g = row["question"], row["answer"], row["ground_truth"]
@@ -155,17 +158,28 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings):
         if answers is None:
             return np.nan
 
-        f1_score = self._compute_statement_presence(answers)
+        return self._compute_statement_presence(answers)
+
+    async def _ascore(self, row: t.Dict, callbacks: Callbacks, is_async: bool) -> float:
+        assert self.llm is not None, "LLM must be set"
 
         if self.weights[1] == 0:
+            f1_score = await self._ascore_factuality(row, callbacks, is_async)
             similarity_score = 0.0
         else:
             assert self.answer_similarity is not None, "AnswerSimilarity must be set"
 
-            similarity_score = await self.answer_similarity.ascore(
-                row, callbacks=callbacks, is_async=is_async
+            # factuality and similarity are independent, run them concurrently
+            f1_score, similarity_score = await asyncio.gather(
+                self._ascore_factuality(row, callbacks, is_async),
+                self.answer_similarity.ascore(
+                    row, callbacks=callbacks, is_async=is_async
+                ),
             )
 
+        if np.isnan(f1_score):
+            return np.nan
+
         score = np.average(
             [f1_score, similarity_score],
             weights=self.weights,
@@ -176,7 +190,7 @@ class AnswerCorrectness(MetricWithLLM, MetricWithEmbeddings):
     def adapt(self, language: str, cache_dir: t.Optional[str] = None) -> None:
         assert self.llm is not None, "llm must be set to compute score"
 
-        logger.info(f"Adapting AnswerCorrectness metric to {language}")
+        logger.info("Adapting AnswerCorrectness metric to %s", language)
         self.correctness_prompt = self.correctness_prompt.adapt(
             language, self.llm, cache_dir
         )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -106,37 +107,64 @@ class AnswerRelevancy(MetricWithLLM, MetricWithEmbeddings):
     question_generation: Prompt = field(default_factory=lambda: QUESTION_GEN)
     strictness: int = 3
 
+    @staticmethod
+    def _cosine_similarity(question_vec: np.ndarray, gen_question_vec: np.ndarray):
+        question_vec = question_vec.reshape(-1) / np.linalg.norm(question_vec)
+        gen_question_vec = gen_question_vec / np.linalg.norm(
+            gen_question_vec, axis=1, keepdims=True
+        )
+        return gen_question_vec @ question_vec
+
     def calculate_similarity(
         self: t.Self, question: str, generated_questions: list[str]
+    ):
+        return asyncio.run(
+            self.acalculate_similarity(question, generated_questions, is_async=False)
+        )
+
+    async def acalculate_similarity(
+        self: t.Self,
+        question: str,
+        generated_questions: list[str],
+        is_async: bool = True,
     ):
         assert self.embeddings is not None
-        question_vec = np.asarray(self.embeddings.embed_query(question)).reshape(1, -1)
-        gen_question_vec = np.asarray(
-            self.embeddings.embed_documents(generated_questions)
-        ).reshape(len(generated_questions), -1)
-        norm = np.linalg.norm(gen_question_vec, axis=1) * np.linalg.norm(
-            question_vec, axis=1
+        # sampled questions often repeat, embed each distinct question only once
+        unique_questions, inverse = np.unique(generated_questions, return_inverse=True)
+        # the question is a query, the generated questions are compared to it.
+        # local models such as sentence-transformers are not thread safe, so
+        # the two calls are not run concurrently
+        question_vec = await self.embeddings.embed_query_text(
+            question, is_async=is_async
         )
-        return (
-            np.dot(gen_question_vec, question_vec.T).reshape(
-                -1,
-            )
-            / norm
+        gen_question_vec = await self.embeddings.embed_texts(
+            unique_questions.tolist(), is_async=is_async
+        )
+        gen_question_vec = np.asarray(gen_question_vec).reshape(
+            len(unique_questions), -1
+        )
+        return self._cosine_similarity(
+            np.asarray(question_vec), gen_question_vec[inverse]
         )
 
-    def _calculate_score(
-        self, answers: t.Sequence[AnswerRelevanceClassification], row: t.Dict
+    async def _acalculate_score(
+        self,
+        answers: t.Sequence[AnswerRelevanceClassification],
+        row: t.Dict,
+        is_async: bool,
     ) -> float:
         question = row["question"]
         gen_questions = [answer.question for answer in answers]
-        committal = np.any([answer.noncommittal for answer in answers])
+        committal = any(answer.noncommittal for answer in answers)
         if all(q == "" for q in gen_questions):
             logger.warning(
                 "Invalid JSON response. Expected dictionary with key 'question'"
             )
             score = np.nan
         else:
-            cosine_sim = self.calculate_similarity(question, gen_questions)
+            cosine_sim = await self.acalculate_similarity(
+                question, gen_questions, is_async=is_async
+            )
             score = cosine_sim.mean() * int(not committal)
 
         return score
@@ -156,20 +184,22 @@ class AnswerRelevancy(MetricWithLLM, MetricWithEmbeddings):
             is_async=is_async,
         )
 
-        answers = [
-            await _output_parser.aparse(result.text, prompt, self.llm)
-            for result in result.generations[0]
-        ]
+        answers = await asyncio.gather(
+            *[
+                _output_parser.aparse(result.text, prompt, self.llm)
+                for result in result.generations[0]
+            ]
+        )
         if any(answer is None for answer in answers):
             return np.nan
 
         answers = [answer for answer in answers if answer is not None]
-        return self._calculate_score(answers, row)
+        return await self._acalculate_score(answers, row, is_async)
 
     def adapt(self, language: str, cache_dir: str | None = None) -> None:
         assert self.llm is not None, "LLM is not set"
 
-        logger.info(f"Adapting AnswerRelevancy metric to {language}")
+        logger.info("Adapting AnswerRelevancy metric to %s", language)
         self.question_generation = self.question_generation.adapt(
             language, self.llm, cache_dir
         )
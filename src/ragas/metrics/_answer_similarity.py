@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import numpy as np
@@ -15,6 +17,12 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# cross encoder models and their fast tokenizers are not safe to call from
+# several threads at once, so every prediction goes through one worker
+_cross_encoder_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="ragas-cross-encoder"
+)
+
 
 @dataclass
 class AnswerSimilarity(MetricWithLLM, MetricWithEmbeddings):
@@ -58,19 +66,24 @@ class AnswerSimilarity(MetricWithLLM, MetricWithEmbeddings):
         answer = t.cast(str, row["answer"])
 
         if self.is_cross_encoder and isinstance(self.embeddings, HuggingfaceEmbeddings):
-            raise NotImplementedError(
-                "async score [ascore()] not implemented for HuggingFace embeddings"
-            )
+            # cross encoder inference is blocking, keep it off the event loop
+            loop = asyncio.get_event_loop()
+            score = np.asarray(
+                await loop.run_in_executor(
+                    _cross_encoder_executor,
+                    self.embeddings.predict,
+                    [[ground_truth, answer]],
+                )
+            ).flatten()
         else:
-            embedding_1 = np.array(await self.embeddings.embed_text(ground_truth))
-            embedding_2 = np.array(await self.embeddings.embed_text(answer))
-            # Normalization factors of the above embeddings
-            norms_1 = np.linalg.norm(embedding_1, keepdims=True)
-            norms_2 = np.linalg.norm(embedding_2, keepdims=True)
-            embedding_1_normalized = embedding_1 / norms_1
-            embedding_2_normalized = embedding_2 / norms_2
-            similarity = embedding_1_normalized @ embedding_2_normalized.T
-            score = similarity.flatten()
+            # embed ground truth and answer in a single request
+            embeddings = np.asarray(
+                await self.embeddings.embed_texts(
+                    [ground_truth, answer], is_async=is_async
+                )
+            )
+            embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+            score = np.atleast_1d(embeddings[0] @ embeddings[1])
 
         assert isinstance(score, np.ndarray), "Expects ndarray"
         if self.threshold:
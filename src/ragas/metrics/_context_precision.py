@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
 from dataclasses import dataclass, field
@@ -41,8 +42,8 @@ CONTEXT_PRECISION = Prompt(
     examples=[
         {
             "question": """What can you tell me about albert Albert Einstein?""",
-            "context": """Albert Einstein (14 March 1879 – 18 April 1955) was a German-born theoretical physicist, widely held to be one of the greatest and most influential scientists of all time. Best known for developing the theory of relativity, he also made important contributions to quantum mechanics, and was thus a central figure in the revolutionary reshaping of the scientific understanding of nature that modern physics accomplished in the first decades of the twentieth century. His mass–energy equivalence formula E = mc2, which arises from relativity theory, has been called "the world's most famous equation". He received the 1921 Nobel Prize in Physics "for his services to theoretical physics, and especially for his discovery of the law of the photoelectric effect", a pivotal step in the development of quantum theory. His work is also known for its influence on the philosophy of science. In a 1999 poll of 130 leading physicists worldwide by the British journal Physics World, Einstein was ranked the greatest physicist of all time. His intellectual achievements and originality have made Einstein synonymous with genius.""",
             "answer": """Albert Einstein born in 14 March 1879 was German-born theoretical physicist, widely held to be one of the greatest and most influential scientists of all time. He received the 1921 Nobel Prize in Physics for his services to theoretical physics. He published 4 papers in 1905. Einstein moved to Switzerland in 1895""",
+            "context": """Albert Einstein (14 March 1879 – 18 April 1955) was a German-born theoretical physicist, widely held to be one of the greatest and most influential scientists of all time. Best known for developing the theory of relativity, he also made important contributions to quantum mechanics, and was thus a central figure in the revolutionary reshaping of the scientific understanding of nature that modern physics accomplished in the first decades of the twentieth century. His mass–energy equivalence formula E = mc2, which arises from relativity theory, has been called "the world's most famous equation". He received the 1921 Nobel Prize in Physics "for his services to theoretical physics, and especially for his discovery of the law of the photoelectric effect", a pivotal step in the development of quantum theory. His work is also known for its influence on the philosophy of science. In a 1999 poll of 130 leading physicists worldwide by the British journal Physics World, Einstein was ranked the greatest physicist of all time. His intellectual achievements and originality have made Einstein synonymous with genius.""",
             "verification": ContextPrecisionVerification(
                 reason="The provided context was indeed useful in arriving at the given answer. The context includes key information about Albert Einstein's life and contributions, which are reflected in the answer.",
                 verdict=1,
@@ -50,8 +51,8 @@ CONTEXT_PRECISION = Prompt(
         },
         {
             "question": """who won 2020 icc world cup?""",
-            "context": """The 2022 ICC Men's T20 World Cup, held from October 16 to November 13, 2022, in Australia, was the eighth edition of the tournament. Originally scheduled for 2020, it was postponed due to the COVID-19 pandemic. England emerged victorious, defeating Pakistan by five wickets in the final to clinch their second ICC Men's T20 World Cup title.""",
             "answer": """England""",
+            "context": """The 2022 ICC Men's T20 World Cup, held from October 16 to November 13, 2022, in Australia, was the eighth edition of the tournament. Originally scheduled for 2020, it was postponed due to the COVID-19 pandemic. England emerged victorious, defeating Pakistan by five wickets in the final to clinch their second ICC Men's T20 World Cup title.""",
             "verification": ContextPrecisionVerification(
                 reason="the context was useful in clarifying the situation regarding the 2020 ICC World Cup and indicating that England was the winner of the tournament that was intended to be held in 2020 but actually took place in 2022.",
                 verdict=1,
@@ -59,15 +60,16 @@ CONTEXT_PRECISION = Prompt(
         },
         {
             "question": """What is the tallest mountain in the world?""",
-            "context": """The Andes is the longest continental mountain range in the world, located in South America. It stretches across seven countries and features many of the highest peaks in the Western Hemisphere. The range is known for its diverse ecosystems, including the high-altitude Andean Plateau and the Amazon rainforest.""",
             "answer": """Mount Everest.""",
+            "context": """The Andes is the longest continental mountain range in the world, located in South America. It stretches across seven countries and features many of the highest peaks in the Western Hemisphere. The range is known for its diverse ecosystems, including the high-altitude Andean Plateau and the Amazon rainforest.""",
             "verification": ContextPrecisionVerification(
                 reason="the provided context discusses the Andes mountain range, which, while impressive, does not include Mount Everest or directly relate to the question about the world's tallest mountain.",
                 verdict=0,
             ).dict(),
         },
     ],
-    input_keys=["question", "context", "answer"],
+    # context goes last so the prompts of a row share the longest prefix
+    input_keys=["question", "answer", "context"],
     output_key="verification",
     output_type="json",
 )
@@ -115,14 +117,13 @@ class ContextPrecision(MetricWithLLM):
     ) -> float:
         score = np.nan
 
-        verdict_list = [1 if ver.verdict else 0 for ver in verifications]
-        denominator = sum(verdict_list) + 1e-10
-        numerator = sum(
-            [
-                (sum(verdict_list[: i + 1]) / (i + 1)) * verdict_list[i]
-                for i in range(len(verdict_list))
-            ]
+        verdicts = np.array(
+            [1 if ver.verdict else 0 for ver in verifications], dtype=np.float64
         )
+        # precision@k for every k in a single pass
+        precision_at_k = np.cumsum(verdicts) / np.arange(1, len(verdicts) + 1)
+        denominator = verdicts.sum() + 1e-10
+        numerator = float(np.sum(precision_at_k * verdicts))
         score = numerator / denominator
         if np.isnan(score):
             logger.warning(
@@ -139,20 +140,36 @@ class ContextPrecision(MetricWithLLM):
         assert self.llm is not None, "LLM is not set"
 
         human_prompts = self._context_precision_prompt(row)
-        responses = []
+        # duplicate contexts render identical prompts, verify each one only once
+        unique_prompts: t.Dict[str, PromptValue] = {}
         for hp in human_prompts:
-            result = await self.llm.generate(
-                hp,
-                n=1,
-                callbacks=callbacks,
-                is_async=is_async,
-            )
-            responses.append([result.generations[0][0].text, hp])
-
-        items = [
-            await _output_parser.aparse(item, hp, self.llm, self.max_retries)
-            for item, hp in responses
+            unique_prompts.setdefault(hp.to_string(), hp)
+        prompts = list(unique_prompts.values())
+
+        # verify every distinct context of the row concurrently
+        results = await asyncio.gather(
+            *[
+                self.llm.generate(
+                    hp,
+                    n=1,
+                    callbacks=callbacks,
+                    is_async=is_async,
+                )
+                for hp in prompts
+            ]
+        )
+        responses = [
+            [result.generations[0][0].text, hp] for result, hp in zip(results, prompts)
         ]
+
+        parsed = await asyncio.gather(
+            *[
+                _output_parser.aparse(item, hp, self.llm, self.max_retries)
+                for item, hp in responses
+            ]
+        )
+        verified = dict(zip(unique_prompts, parsed))
+        items = [verified[hp.to_string()] for hp in human_prompts]
         if any(item is None for item in items):
             return np.nan
 
@@ -164,7 +181,7 @@ class ContextPrecision(MetricWithLLM):
     def adapt(self, language: str, cache_dir: str | None = None) -> None:
         assert self.llm is not None, "LLM is not set"
 
-        logging.info(f"Adapting Context Precision to {language}")
+        logger.info("Adapting Context Precision to %s", language)
         self.context_precision_prompt = self.context_precision_prompt.adapt(
             language, self.llm, cache_dir
         )
@@ -131,9 +131,8 @@ class ContextRecall(MetricWithLLM):
         return self.context_recall_prompt.format(question=qstn, context=ctx, answer=gt)
 
     def _compute_score(self, response: t.Any) -> float:
-        response = [1 if item.attributed else 0 for item in response.__root__]
-        denom = len(response)
-        numerator = sum(response)
+        denom = len(response.__root__)
+        numerator = sum(1 for item in response.__root__ if item.attributed)
         score = numerator / denom if denom > 0 else np.nan
 
         if np.isnan(score):
@@ -162,7 +161,7 @@ class ContextRecall(MetricWithLLM):
     def adapt(self, language: str, cache_dir: str | None = None) -> None:
         assert self.llm is not None, "set LLM before use"
 
-        logger.info(f"Adapting Context Recall to {language}")
+        logger.info("Adapting Context Recall to %s", language)
         self.context_recall_prompt = self.context_recall_prompt.adapt(
             language, self.llm, cache_dir
         )
@@ -86,7 +86,7 @@ class ContextRelevancy(MetricWithLLM):
     def adapt(self, language: str, cache_dir: str | None = None) -> None:
         assert self.llm is not None, "set LLM before use"
 
-        logger.info(f"Adapting Context Relevancy to {language}")
+        logger.info("Adapting Context Relevancy to %s", language)
         self.context_relevancy_prompt = self.context_relevancy_prompt.adapt(
             language, self.llm, cache_dir
         )
@@ -181,12 +181,13 @@ class Faithfulness(MetricWithLLM):
 
     def _compute_score(self, answers: StatementFaithfulnessAnswers):
         # check the verdicts and compute the score
-        faithful_statements = sum(
-            1 if answer.verdict else 0 for answer in answers.__root__
+        verdicts = np.fromiter(
+            (answer.verdict for answer in answers.__root__),
+            dtype=bool,
+            count=len(answers.__root__),
         )
-        num_statements = len(answers.__root__)
-        if num_statements:
-            score = faithful_statements / num_statements
+        if verdicts.size:
+            score = float(verdicts.mean())
         else:
             logger.warning("No statements were generated from the answer.")
             score = np.nan
@@ -211,7 +212,13 @@ class Faithfulness(MetricWithLLM):
         if statements is None:
             return np.nan
 
-        p_value = self._create_nli_prompt(row, statements.__root__)
+        statement_list = [st for st in statements.__root__ if st.strip()]
+        if not statement_list:
+            # nothing to verify, skip the NLI call
+            logger.warning("No statements were generated from the answer.")
+            return np.nan
+
+        p_value = self._create_nli_prompt(row, statement_list)
         nli_result = await self.llm.generate(
             p_value, callbacks=callbacks, is_async=is_async
         )
@@ -228,7 +235,7 @@ class Faithfulness(MetricWithLLM):
     def adapt(self, language: str, cache_dir: t.Optional[str] = None) -> None:
         assert self.llm is not None, "LLM is not set"
 
-        logger.info(f"Adapting Faithfulness metric to {language}")
+        logger.info("Adapting Faithfulness metric to %s", language)
         self.long_form_answer_prompt = self.long_form_answer_prompt.adapt(
             language, self.llm, cache_dir
         )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import typing as t
-from collections import Counter
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -109,9 +109,13 @@ class AspectCritique(MetricWithLLM):
 
     def _compute_score(self, safe_loaded_responses: t.List[CriticClassification]):
         if self.strictness > 1:
-            score = Counter(
-                [item.verdict for item in safe_loaded_responses]
-            ).most_common(1)[0][0]
+            # verdicts are binary, majority vote is whether more than half are 1
+            votes = np.fromiter(
+                (bool(item.verdict) for item in safe_loaded_responses),
+                dtype=bool,
+                count=len(safe_loaded_responses),
+            )
+            score = int(votes.sum() * 2 > votes.size)
         else:
             score = safe_loaded_responses[0].verdict
 
@@ -125,15 +129,22 @@ class AspectCritique(MetricWithLLM):
         q, c, a = row["question"], row["contexts"], row["answer"]
 
         p_value = self.prompt_format(q, a, c)
+        # request all self consistency checks at once, the wrapper falls back
+        # to concurrent single completions when the model does not support n
         result = await self.llm.generate(
-            p_value, callbacks=callbacks, is_async=is_async
+            p_value,
+            n=self.strictness,
+            callbacks=callbacks,
+            is_async=is_async,
         )
 
         responses = [r.text for r in result.generations[0]]
-        safe_loaded_responses = [
-            await _output_parser.aparse(r, p_value, self.llm, self.max_retries)
-            for r in responses
-        ]
+        safe_loaded_responses = await asyncio.gather(
+            *[
+                _output_parser.aparse(r, p_value, self.llm, self.max_retries)
+                for r in responses
+            ]
+        )
         if any(item is None for item in safe_loaded_responses):
             return np.nan
 
@@ -145,7 +156,7 @@ class AspectCritique(MetricWithLLM):
     def adapt(self, language: str, cache_dir: str | None = None) -> None:
         assert self.llm is not None, "set LLM before use"
 
-        logger.info(f"Adapting Critic to {language}")
+        logger.info("Adapting Critic to %s", language)
         self.critic_prompt.adapt(language, self.llm, cache_dir)
 
     def save(self, cache_dir: str | None = None) -> None:
@@ -0,0 +1,21 @@
+import pytest
+
+from ragas.llms.json_load import json_loader
+
+
+@pytest.mark.parametrize(
+    ["text", "expected"],
+    [
+        ('{"a": 1}', [{"a": 1}]),
+        (" [1, 2] ", [[1, 2]]),
+        ('```json\n{"a": [1]}\n```', [{"a": [1]}]),
+        ('first {"a": 1} then {"b": 2}', [{"a": 1}, {"b": 2}]),
+    ],
+)
+def test_load_all_jsons(text, expected):
+    assert json_loader._load_all_jsons(text) == expected
+
+
+def test_load_all_jsons_rejects_bare_scalars():
+    with pytest.raises(ValueError):
+        json_loader._load_all_jsons("3")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
+import pytest
 from langchain_core.outputs import Generation, LLMResult
 
 from ragas.llms.base import BaseRagasLLM
@@ -24,3 +26,28 @@ class FakeTestLLM(BaseRagasLLM):
         self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
     ):
         return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+class SlowTestLLM(FakeTestLLM):
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def agenerate_text(
+        self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
+    ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+@pytest.mark.asyncio
+async def test_generate_caps_requests_in_flight():
+    from ragas.llms.prompt import PromptValue
+    from ragas.run_config import RunConfig
+
+    llm = SlowTestLLM(run_config=RunConfig(max_workers=2))
+    prompt = PromptValue(prompt_str="hello")
+    await asyncio.gather(*[llm.generate(prompt) for _ in range(6)])
+    assert llm.max_in_flight == 2
@@ -121,3 +121,27 @@ def test_prompt_object_names():
                     obj.name not in prompt_object_names
                 ), f"Duplicate prompt name: {obj.name}"
                 prompt_object_names.append(obj.name)
+
+
+def test_prompt_format_after_update():
+    prompt = Prompt(**TESTCASES[0])
+    kwargs = {k: "value" for k in prompt.input_keys}
+    assert prompt.format(**kwargs).to_string() == prompt.to_string().format(**kwargs)
+
+    prompt.instruction = "A different instruction."
+    assert "A different instruction." in prompt.format(**kwargs).to_string()
+
+
+def test_prompt_format_after_copy_and_in_place_edit():
+    prompt = Prompt(**TESTCASES[0])
+    kwargs = {k: "value" for k in prompt.input_keys}
+    prompt.format(**kwargs)
+
+    copied = prompt.copy(update={"instruction": "A copied instruction."})
+    assert "A copied instruction." in copied.format(**kwargs).to_string()
+    assert "A copied instruction." not in prompt.format(**kwargs).to_string()
+
+    example = dict(prompt.examples[0])
+    example[prompt.input_keys[0]] = "An appended example."
+    prompt.examples.append(example)
+    assert "An appended example." in prompt.format(**kwargs).to_string()
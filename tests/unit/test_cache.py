@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.outputs import Generation, LLMResult
+from langchain_openai.embeddings import OpenAIEmbeddings
+
+from ragas.cache import InMemoryCache, make_cache_key
+from ragas.embeddings.base import BaseRagasEmbeddings, LangchainEmbeddingsWrapper
+from ragas.llms.base import BaseRagasLLM
+from ragas.llms.prompt import PromptValue
+from ragas.run_config import RunConfig
+
+
+class CountingLLM(BaseRagasLLM):
+    calls: int = 0
+
+    def generate_text(
+        self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
+    ):
+        self.calls += 1
+        generations = [[Generation(text=prompt.prompt_str)] * n]
+        return LLMResult(generations=generations)
+
+    async def agenerate_text(
+        self, prompt: PromptValue, n=1, temperature=1e-8, stop=None, callbacks=[]
+    ):
+        return self.generate_text(prompt, n, temperature, stop, callbacks)
+
+
+class CountingEmbeddings(BaseRagasEmbeddings):
+    def __init__(self):
+        self.run_config = RunConfig()
+        self.embedded = []
+
+    def embed_query(self, text: str):
+        return self.embed_documents([text])[0]
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(text))] for text in texts]
+
+
+def test_make_cache_key_is_stable():
+    key = make_cache_key({"b": 1, "a": 2}, "x")
+    assert key == make_cache_key({"a": 2, "b": 1}, "x")
+    assert make_cache_key("x", 1) != make_cache_key("x", 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_async", [True, False])
+async def test_llm_generate_uses_cache(is_async):
+    llm = CountingLLM(run_config=RunConfig())
+    llm.cache = InMemoryCache()
+    prompt = PromptValue(prompt_str="hello")
+
+    first = await llm.generate(prompt, is_async=is_async)
+    second = await llm.generate(prompt, is_async=is_async)
+    assert llm.calls == 1
+    assert first.generations[0][0].text == second.generations[0][0].text
+
+    await llm.generate(prompt, n=3, is_async=is_async)
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_only_embeds_missing_texts():
+    embeddings = CountingEmbeddings()
+    embeddings.cache = InMemoryCache()
+
+    assert await embeddings.embed_texts(["a", "bb"]) == [[1.0], [2.0]]
+    assert await embeddings.embed_texts(["bb", "ccc"]) == [[2.0], [3.0]]
+    assert embeddings.embedded == ["a", "bb", "ccc"]
+
+
+class EvictingCache(InMemoryCache):
+    """Has always evicted the entry by the time get() is called."""
+
+    def get(self, key, default=None):
+        return default
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_between_lookups_recomputes():
+    llm = CountingLLM(run_config=RunConfig())
+    llm.cache = EvictingCache()
+    result = await llm.generate(PromptValue(prompt_str="hello"))
+    assert result.generations[0][0].text == "hello"
+
+    embeddings = CountingEmbeddings()
+    embeddings.cache = EvictingCache()
+    assert await embeddings.embed_texts(["a"]) == [[1.0]]
+
+
+def test_llm_subclass_can_declare_required_fields():
+    @dataclass
+    class ModelLLM(CountingLLM):
+        model: str
+
+    llm = ModelLLM(RunConfig(), "gpt")
+    assert llm.model == "gpt" and llm.cache is None
+
+
+@pytest.mark.parametrize(
+    ["first", "second"],
+    [
+        [
+            HuggingFaceEmbeddings.construct(model_name="BAAI/bge-small-en-v1.5"),
+            HuggingFaceEmbeddings.construct(model_name="BAAI/bge-base-en-v1.5"),
+        ],
+        [
+            OpenAIEmbeddings.construct(model="text-embedding-3-small"),
+            OpenAIEmbeddings.construct(model="text-embedding-3-small", dimensions=256),
+        ],
+    ],
+)
+def test_langchain_embeddings_cache_namespace_tracks_model_params(first, second):
+    first_namespace = LangchainEmbeddingsWrapper(first).get_cache_namespace()
+    second_namespace = LangchainEmbeddingsWrapper(second).get_cache_namespace()
+    assert first_namespace != second_namespace
+    assert make_cache_key(first_namespace) == make_cache_key(
+        LangchainEmbeddingsWrapper(first).get_cache_namespace()
+    )
@@ -1 +1,63 @@
 from __future__ import annotations
+
+import pytest
+
+from ragas.cache import InMemoryCache
+from ragas.embeddings.base import HuggingfaceEmbeddings
+
+
+def _pair_length(pair):
+    return float(sum(len(text) for text in pair))
+
+
+@pytest.fixture
+def stub_cross_encoder_cls():
+    torch = pytest.importorskip("torch")
+    cross_encoder = pytest.importorskip("sentence_transformers.cross_encoder")
+
+    class StubCrossEncoder(cross_encoder.CrossEncoder):
+        def __init__(self):
+            self.seen = []
+
+        def predict(self, sentences, **kwargs):
+            self.seen.extend(sentences)
+            return torch.tensor([_pair_length(pair) for pair in sentences])
+
+    class StubCrossEncoderEmbeddings(HuggingfaceEmbeddings):
+        def __post_init__(self):
+            self.is_cross_encoder = True
+            self.model = StubCrossEncoder()
+            self.encode_kwargs["convert_to_tensor"] = True
+
+    return StubCrossEncoderEmbeddings
+
+
+@pytest.fixture
+def stub_cross_encoder_embeddings(stub_cross_encoder_cls):
+    return stub_cross_encoder_cls()
+
+
+def test_cross_encoder_predict_keeps_input_order(stub_cross_encoder_embeddings):
+    pairs = [["aaaa", "b"], ["a", "b"], ["aaaaaaa", "bb"], ["a", "bbb"], ["ab", ""]]
+
+    scores = stub_cross_encoder_embeddings.predict(pairs)
+
+    assert scores == [_pair_length(pair) for pair in pairs]
+    # the model saw the pairs shortest first
+    seen = stub_cross_encoder_embeddings.model.seen
+    assert [_pair_length(pair) for pair in seen] == sorted(map(_pair_length, pairs))
+
+
+def test_cross_encoder_predict_scores_only_uncached_pairs(stub_cross_encoder_cls):
+    cache = InMemoryCache()
+    embeddings = stub_cross_encoder_cls(cache=cache)
+
+    assert embeddings.predict([["a", "b"], ["aa", "b"]]) == [2.0, 3.0]
+    assert embeddings.predict([["aa", "b"], ["aaa", "b"]]) == [3.0, 4.0]
+    assert embeddings.model.seen == [["a", "b"], ["aa", "b"], ["aaa", "b"]]
+
+    # different encode options must not reuse the cached scores
+    other = stub_cross_encoder_cls(cache=cache, encode_kwargs={"batch_size": 4})
+    assert other.get_cache_namespace() != embeddings.get_cache_namespace()
+    other.predict([["a", "b"]])
+    assert other.model.seen == [["a", "b"]]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import pytest
+
+from ragas.metrics._context_precision import ContextPrecisionVerification
+
+
+def _average_precision_reference(verdicts):
+    numerator = sum(
+        (sum(verdicts[: i + 1]) / (i + 1)) * verdicts[i] for i in range(len(verdicts))
+    )
+    return numerator / (sum(verdicts) + 1e-10)
+
+
+@pytest.mark.parametrize(
+    "verdicts",
+    [[1], [0], [1, 0, 1], [0, 0, 1, 1], [1, 1, 1, 0, 0, 1], []],
+)
+def test_context_precision_average_precision(verdicts):
+    from ragas.metrics import context_precision
+
+    verifications = [
+        ContextPrecisionVerification(reason="", verdict=v) for v in verdicts
+    ]
+    score = context_precision._calculate_average_precision(verifications)
+    assert score == pytest.approx(_average_precision_reference(verdicts))
+
+
+@pytest.mark.parametrize(
+    ["verdicts", "expected"],
+    [[[1, 0, 1, 1], 0.75], [[0, 0], 0.0], [[1], 1.0]],
+)
+def test_faithfulness_compute_score(verdicts, expected):
+    from ragas.metrics import faithfulness
+    from ragas.metrics._faithfulness import StatementFaithfulnessAnswers
+
+    answers = StatementFaithfulnessAnswers.parse_obj(
+        [{"statement": "s", "reason": "", "verdict": v} for v in verdicts]
+    )
+    assert faithfulness._compute_score(answers) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ["verdicts", "expected"],
+    [[[1, 0, 1], 1], [[0, 0, 1], 0], [[1, 1, 1, 0, 0], 1], [[0, 1, 0, 1, 0], 0]],
+)
+def test_aspect_critique_majority_vote(verdicts, expected):
+    from ragas.metrics.critique import AspectCritique, CriticClassification
+
+    critique = AspectCritique(name="test", definition="test", strictness=3)
+    responses = [CriticClassification(reason="", verdict=v) for v in verdicts]
+    assert critique._compute_score(responses) == expected
+
+
+def test_answer_similarity_cross_encoder_predicts_serially():
+    import asyncio
+    import threading
+    import time
+
+    from ragas.embeddings.base import HuggingfaceEmbeddings
+    from ragas.metrics import AnswerSimilarity
+
+    class StubCrossEncoderEmbeddings(HuggingfaceEmbeddings):
+        def __post_init__(self):
+            self.is_cross_encoder = True
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def predict(self, texts):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            with self.lock:
+                self.in_flight -= 1
+            return [0.25 * len(answer) for _, answer in texts]
+
+    embeddings = StubCrossEncoderEmbeddings()
+    metric = AnswerSimilarity(embeddings=embeddings)
+    assert metric.is_cross_encoder
+
+    rows = [{"ground_truth": "g", "answer": "a" * i} for i in range(1, 5)]
+
+    async def score_all():
+        return await asyncio.gather(
+            *[metric.ascore(row, is_async=False) for row in rows]
+        )
+
+    assert asyncio.run(score_all()) == pytest.approx([0.25, 0.5, 0.75, 1.0])
+    assert embeddings.max_in_flight == 1
+    assert metric.score(rows[0]) == pytest.approx(0.25)
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_answer_relevancy_embeds_question_as_query(use_async):
+    import asyncio
+
+    from langchain_core.embeddings import Embeddings
+
+    from ragas.embeddings import LangchainEmbeddingsWrapper
+    from ragas.metrics import AnswerRelevancy
+
+    class AsymmetricEmbeddings(Embeddings):
+        def embed_documents(self, texts):
+            return [[1.0, 0.0] for _ in texts]
+
+        def embed_query(self, text):
+            return [0.0, 1.0]
+
+    metric = AnswerRelevancy(
+        embeddings=LangchainEmbeddingsWrapper(AsymmetricEmbeddings())
+    )
+    if use_async:
+        similarity = asyncio.run(metric.acalculate_similarity("q", ["a", "b"]))
+    else:
+        similarity = metric.calculate_similarity("q", ["a", "b"])
+    assert similarity == pytest.approx([0.0, 0.0])
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_answer_relevancy_embeds_one_request_at_a_time(use_async):
+    import asyncio
+    import threading
+    import time
+
+    from langchain_core.embeddings import Embeddings
+
+    from ragas.embeddings import LangchainEmbeddingsWrapper
+    from ragas.metrics import AnswerRelevancy
+
+    class LocalEmbeddings(Embeddings):
+        """Uses langchain's default executor for the async methods."""
+
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def embed_documents(self, texts):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            with self.lock:
+                self.in_flight -= 1
+            return [[1.0, float(len(text))] for text in texts]
+
+        def embed_query(self, text):
+            return self.embed_documents([text])[0]
+
+    embeddings = LocalEmbeddings()
+    metric = AnswerRelevancy(embeddings=LangchainEmbeddingsWrapper(embeddings))
+    asyncio.run(metric.acalculate_similarity("q", ["a", "b"], is_async=use_async))
+    assert embeddings.max_in_flight == 1